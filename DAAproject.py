@@ -3,13 +3,14 @@ Algorithm Visualizer Pro
 A self-contained Python/Tkinter application to visualize algorithms (sorting + backtracking subset-sum).
 Features:
 - Visualize Bubble, Selection, Insertion, Merge, Quick sort with animations
-- Visualize Subset Sum backtracking (show included/excluded elements)
+- Visualize Subset Sum as a DP table fill, or by backtracking (show included/excluded elements)
 - Controls: Start, Pause, Step, Reset, Randomize, Speed slider, Array size
 - Pseudocode panel with line highlighting
-- Export current frame as PNG
+- Export current frame as PNG (or PostScript when Pillow/Ghostscript are missing)
 
 Run: python Algorithm_Visualizer_Pro.py
-Requires: Python 3.8+, Tkinter (usually included), Pillow (optional, only for exporting screenshots)
+Requires: Python 3.8+, Tkinter (usually included), Pillow (optional, only for exporting PNG),
+Numba + NumPy (optional, compiles the sort kernels)
 
 """
 
@@ -17,25 +18,41 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import random
 import time
+import threading
+import queue
+import collections
+import array
 import math
 import sys
+import io
+import os
 
 try:
-    from PIL import ImageGrab
+    from PIL import Image
     PIL_AVAILABLE = True
 except Exception:
     PIL_AVAILABLE = False
 
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
 def bubble_sort_generator(arr):
     n = len(arr)
+    # bubble sort only ever touches adjacent pairs, so its events are built once per pair and
+    # yielded again on every pass; consumers only read events
+    compares = [{"type": "compare", "indices": (j, j+1)} for j in range(n - 1)]
+    swaps = [{"type": "swap", "indices": (j, j+1)} for j in range(n - 1)]
     for i in range(n):
         for j in range(0, n - i - 1):
-            # compare
-            yield {"type": "compare", "indices": (j, j+1)}
+            yield compares[j]
             if arr[j] > arr[j+1]:
                 arr[j], arr[j+1] = arr[j+1], arr[j]
-                yield {"type": "swap", "indices": (j, j+1), "array": arr.copy()}
-    yield {"type": "done", "array": arr.copy()}
+                yield swaps[j]
+    yield {"type": "done"}
 
 
 def selection_sort_generator(arr):
@@ -49,8 +66,8 @@ def selection_sort_generator(arr):
                 yield {"type": "highlight", "indices": (min_idx,)}
         if min_idx != i:
             arr[i], arr[min_idx] = arr[min_idx], arr[i]
-            yield {"type": "swap", "indices": (i, min_idx), "array": arr.copy()}
-    yield {"type": "done", "array": arr.copy()}
+            yield {"type": "swap", "indices": (i, min_idx)}
+    yield {"type": "done"}
 
 
 def insertion_sort_generator(arr):
@@ -62,15 +79,15 @@ def insertion_sort_generator(arr):
             yield {"type": "compare", "indices": (j, j+1)}
             arr[j+1] = arr[j]
             j -= 1
-            yield {"type": "shift", "indices": (j+1, j+2), "array": arr.copy()}
+            yield {"type": "shift", "indices": (j+1, j+2), "index": j+2, "value": arr[j+2]}
         arr[j+1] = key
-        yield {"type": "insert", "index": j+1, "array": arr.copy()}
-    yield {"type": "done", "array": arr.copy()}
+        yield {"type": "insert", "index": j+1, "value": key}
+    yield {"type": "done"}
 
 
 def merge_sort_generator(arr):
     # We'll implement merge sort using an explicit stack to yield merge steps
-    aux = arr.copy()
+    aux = arr[:]
     n = len(arr)
 
     def merge_range(l, m, r):
@@ -84,15 +101,15 @@ def merge_sort_generator(arr):
                 arr[k] = aux[j]
                 j += 1
             k += 1
-            yield {"type": "mergewrite", "index": k-1, "value": arr[k-1], "array": arr.copy()}
+            yield {"type": "mergewrite", "index": k-1, "value": arr[k-1]}
         while i < m:
             arr[k] = aux[i]
             i += 1; k += 1
-            yield {"type": "mergewrite", "index": k-1, "value": arr[k-1], "array": arr.copy()}
+            yield {"type": "mergewrite", "index": k-1, "value": arr[k-1]}
         while j < r:
             arr[k] = aux[j]
             j += 1; k += 1
-            yield {"type": "mergewrite", "index": k-1, "value": arr[k-1], "array": arr.copy()}
+            yield {"type": "mergewrite", "index": k-1, "value": arr[k-1]}
 
     # bottom-up merge sort
     width = 1
@@ -101,13 +118,16 @@ def merge_sort_generator(arr):
             l = i
             m = min(i+width, n)
             r = min(i+2*width, n)
+            if m >= r or arr[m-1] <= arr[m]:
+                # single run, or the two runs are already in order: nothing to merge
+                continue
             # copy to aux
             for k in range(l, r):
                 aux[k] = arr[k]
             for step in merge_range(l, m, r):
                 yield step
         width *= 2
-    yield {"type": "done", "array": arr.copy()}
+    yield {"type": "done"}
 
 
 def quick_sort_generator(arr):
@@ -122,48 +142,270 @@ def quick_sort_generator(arr):
                 yield {"type": "compare", "indices": (j, high)}
                 if arr[j] < pivot:
                     arr[i], arr[j] = arr[j], arr[i]
-                    yield {"type": "swap", "indices": (i, j), "array": arr.copy()}
+                    yield {"type": "swap", "indices": (i, j)}
                     i += 1
             arr[i], arr[high] = arr[high], arr[i]
-            yield {"type": "swap", "indices": (i, high), "array": arr.copy()}
+            yield {"type": "swap", "indices": (i, high)}
             p = i
             stack.append((low, p-1))
             stack.append((p+1, high))
-    yield {"type": "done", "array": arr.copy()}
+    yield {"type": "done"}
+
+# -----------------------------------------------------------------------------------
+# Numba-recorded sort kernels
+# Numba can't compile generators efficiently, so each kernel sorts a contiguous int32
+# array in one go and logs (op code, a, b) rows into a preallocated event table. The
+# recorded generator then replays that table as the same dicts the Python generators yield.
+
+OP_COMPARE, OP_SWAP, OP_HIGHLIGHT, OP_SHIFT, OP_INSERT, OP_MERGEWRITE = range(6)
+
+
+def _decode_op(code, a, b):
+    if code == OP_COMPARE:
+        return {"type": "compare", "indices": (a, b)}
+    if code == OP_SWAP:
+        return {"type": "swap", "indices": (a, b)}
+    if code == OP_HIGHLIGHT:
+        return {"type": "highlight", "indices": (a,)}
+    if code == OP_SHIFT:
+        return {"type": "shift", "indices": (a-1, a), "index": a, "value": b}
+    if code == OP_INSERT:
+        return {"type": "insert", "index": a, "value": b}
+    return {"type": "mergewrite", "index": a, "value": b}
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def bubble_sort_record(arr, ops):
+        n = arr.shape[0]
+        cursor = 0
+        for i in range(n):
+            for j in range(0, n - i - 1):
+                ops[cursor, 0] = OP_COMPARE; ops[cursor, 1] = j; ops[cursor, 2] = j+1
+                cursor += 1
+                if arr[j] > arr[j+1]:
+                    arr[j], arr[j+1] = arr[j+1], arr[j]
+                    ops[cursor, 0] = OP_SWAP; ops[cursor, 1] = j; ops[cursor, 2] = j+1
+                    cursor += 1
+        return cursor
+
+    @njit(cache=True, nogil=True)
+    def selection_sort_record(arr, ops):
+        n = arr.shape[0]
+        cursor = 0
+        for i in range(n):
+            min_idx = i
+            for j in range(i+1, n):
+                ops[cursor, 0] = OP_COMPARE; ops[cursor, 1] = min_idx; ops[cursor, 2] = j
+                cursor += 1
+                if arr[j] < arr[min_idx]:
+                    min_idx = j
+                    ops[cursor, 0] = OP_HIGHLIGHT; ops[cursor, 1] = j; ops[cursor, 2] = j
+                    cursor += 1
+            if min_idx != i:
+                arr[i], arr[min_idx] = arr[min_idx], arr[i]
+                ops[cursor, 0] = OP_SWAP; ops[cursor, 1] = i; ops[cursor, 2] = min_idx
+                cursor += 1
+        return cursor
+
+    @njit(cache=True, nogil=True)
+    def insertion_sort_record(arr, ops):
+        n = arr.shape[0]
+        cursor = 0
+        for i in range(1, n):
+            key = arr[i]
+            j = i - 1
+            ops[cursor, 0] = OP_HIGHLIGHT; ops[cursor, 1] = i; ops[cursor, 2] = i
+            cursor += 1
+            while j >= 0 and arr[j] > key:
+                ops[cursor, 0] = OP_COMPARE; ops[cursor, 1] = j; ops[cursor, 2] = j+1
+                cursor += 1
+                arr[j+1] = arr[j]
+                ops[cursor, 0] = OP_SHIFT; ops[cursor, 1] = j+1; ops[cursor, 2] = arr[j]
+                cursor += 1
+                j -= 1
+            arr[j+1] = key
+            ops[cursor, 0] = OP_INSERT; ops[cursor, 1] = j+1; ops[cursor, 2] = key
+            cursor += 1
+        return cursor
+
+    @njit(cache=True, nogil=True)
+    def merge_sort_record(arr, ops):
+        n = arr.shape[0]
+        aux = arr.copy()
+        cursor = 0
+        width = 1
+        while width < n:
+            for l in range(0, n, 2*width):
+                m = min(l+width, n)
+                r = min(l+2*width, n)
+                if m >= r or arr[m-1] <= arr[m]:
+                    continue
+                for k in range(l, r):
+                    aux[k] = arr[k]
+                i, j, k = l, m, l
+                while i < m and j < r:
+                    ops[cursor, 0] = OP_COMPARE; ops[cursor, 1] = i; ops[cursor, 2] = j
+                    cursor += 1
+                    if aux[i] <= aux[j]:
+                        arr[k] = aux[i]
+                        i += 1
+                    else:
+                        arr[k] = aux[j]
+                        j += 1
+                    ops[cursor, 0] = OP_MERGEWRITE; ops[cursor, 1] = k; ops[cursor, 2] = arr[k]
+                    cursor += 1
+                    k += 1
+                while i < m:
+                    arr[k] = aux[i]
+                    ops[cursor, 0] = OP_MERGEWRITE; ops[cursor, 1] = k; ops[cursor, 2] = arr[k]
+                    cursor += 1
+                    i += 1; k += 1
+                while j < r:
+                    arr[k] = aux[j]
+                    ops[cursor, 0] = OP_MERGEWRITE; ops[cursor, 1] = k; ops[cursor, 2] = arr[k]
+                    cursor += 1
+                    j += 1; k += 1
+            width *= 2
+        return cursor
+
+    @njit(cache=True, nogil=True)
+    def quick_sort_record(arr, ops):
+        n = arr.shape[0]
+        stack = np.empty((2*n + 2, 2), dtype=np.int64)
+        stack[0, 0] = 0; stack[0, 1] = n - 1
+        top = 1
+        cursor = 0
+        while top > 0:
+            top -= 1
+            low = stack[top, 0]; high = stack[top, 1]
+            if low < high:
+                pivot = arr[high]
+                i = low
+                for j in range(low, high):
+                    ops[cursor, 0] = OP_COMPARE; ops[cursor, 1] = j; ops[cursor, 2] = high
+                    cursor += 1
+                    # branchless partition step: the compare feeds selects and index bumps instead of
+                    # a jump; the swap row is always written but only kept (cursor advanced) when less
+                    less = arr[j] < pivot
+                    a = arr[i]
+                    b = arr[j]
+                    arr[i] = b if less else a
+                    arr[j] = a if less else b
+                    ops[cursor, 0] = OP_SWAP; ops[cursor, 1] = i; ops[cursor, 2] = j
+                    cursor += less
+                    i += less
+                arr[i], arr[high] = arr[high], arr[i]
+                ops[cursor, 0] = OP_SWAP; ops[cursor, 1] = i; ops[cursor, 2] = high
+                cursor += 1
+                stack[top, 0] = low; stack[top, 1] = i - 1
+                stack[top+1, 0] = i + 1; stack[top+1, 1] = high
+                top += 2
+        return cursor
+
+    # kernel and an upper bound on the number of event rows it can log for n elements
+    SORT_KERNELS = {
+        'bubble': (bubble_sort_record, lambda n: n*n),
+        'selection': (selection_sort_record, lambda n: n*n + n),
+        'insertion': (insertion_sort_record, lambda n: n*n + 2*n),
+        'merge': (merge_sort_record, lambda n: 2*n*(n.bit_length() + 1)),
+        'quick': (quick_sort_record, lambda n: n*n + n),
+    }
+
+
+def recorded_sort_generator(kernel, rows, arr):
+    # arr is an array('i'); the kernel sorts it in place through a zero-copy view
+    buf = np.frombuffer(arr, dtype=np.intc)
+    ops = np.empty((rows, 3), dtype=np.int32)
+    cursor = kernel(buf, ops)
+    for code, a, b in ops[:cursor].tolist():
+        yield _decode_op(code, a, b)
+    yield {"type": "done"}
+
+
+SORT_GENERATORS = {
+    'bubble': bubble_sort_generator,
+    'selection': selection_sort_generator,
+    'insertion': insertion_sort_generator,
+    'merge': merge_sort_generator,
+    'quick': quick_sort_generator,
+}
+
+
+def sort_generator(key, arr):
+    # use the compiled kernel when Numba is available, the plain generator otherwise
+    if NUMBA_AVAILABLE:
+        kernel, rows = SORT_KERNELS[key]
+        return recorded_sort_generator(kernel, rows(len(arr)), arr)
+    return SORT_GENERATORS[key](arr)
 
 def subset_sum_generator(arr, target):
     n = len(arr)
-    chosen = [False]*n
 
-    def backtrack(i, current_sum):
-        if i == n:
-            # yield a check
-            yield {"type": "check", "chosen": chosen.copy(), "sum": current_sum}
-            return
-        # exclude
-        chosen[i] = False
-        yield {"type": "decide", "index": i, "choice": False, "chosen": chosen.copy(), "sum": current_sum}
-        for step in backtrack(i+1, current_sum):
-            yield step
-        # include
-        chosen[i] = True
-        yield {"type": "decide", "index": i, "choice": True, "chosen": chosen.copy(), "sum": current_sum + arr[i]}
-        for step in backtrack(i+1, current_sum + arr[i]):
-            yield step
-        chosen[i] = False
-
-    for step in backtrack(0, 0):
-        # if we hit a full assignment that equals target, yield a solution marker
-        if step.get("type") == "check" and step.get("sum") == target:
-            step["type"] = "solution"
-            yield step
+    def backtrack():
+        # explicit stack instead of recursion, so every step is yielded from this one frame
+        # phase 0: exclude i and descend, 1: include i and descend
+        # chosen elements are a bitmask (bit i set = arr[i] included); ints are immutable, so
+        # each frame carries its own mask and events can share it without copying
+        stack = [(0, 0, 0, 0)]
+        while stack:
+            i, current_sum, mask, phase = stack.pop()
+            if i == n:
+                # full assignment: a check, or a solution marker if it hits the target
+                yield {"type": "solution" if current_sum == target else "check", "mask": mask, "sum": current_sum}
+            elif phase == 0:
+                yield {"type": "decide", "index": i, "choice": False, "mask": mask, "sum": current_sum}
+                stack.append((i, current_sum, mask, 1))
+                stack.append((i+1, current_sum, mask, 0))
+            else:
+                mask |= 1 << i
+                yield {"type": "decide", "index": i, "choice": True, "mask": mask, "sum": current_sum + arr[i]}
+                stack.append((i+1, current_sum + arr[i], mask, 0))
+
+    yield from backtrack()
+    yield {"type": "done"}
+
+
+def subset_sum_dp_generator(arr, target):
+    # bottom-up table: dp[i][t] is True when some subset of arr[i:] sums to t
+    n = len(arr)
+    # out-of-range targets have no solution; this also caps the table at n*sum(arr)
+    if target < 0 or target > sum(arr):
+        yield {"type": "nosolution", "sum": target}
+        yield {"type": "done"}
+        return
+    dp = [[False]*(target+1) for _ in range(n+1)]
+    for i in range(n+1):
+        dp[i][0] = True
+    for i in range(n-1, -1, -1):
+        for t in range(target+1):
+            dp[i][t] = dp[i+1][t] or (t >= arr[i] and dp[i+1][t-arr[i]])
+            yield {"type": "dp_fill", "i": i, "t": t, "value": dp[i][t]}
+    if not dp[0][target]:
+        yield {"type": "nosolution", "sum": target}
+        yield {"type": "done"}
+        return
+    # walk back from (0, target) to recover one solution
+    mask = 0
+    t = target
+    current_sum = 0
+    for i in range(n):
+        if dp[i+1][t]:
+            yield {"type": "decide", "index": i, "choice": False, "mask": mask, "sum": current_sum}
         else:
-            yield step
+            mask |= 1 << i
+            t -= arr[i]
+            current_sum += arr[i]
+            yield {"type": "decide", "index": i, "choice": True, "mask": mask, "sum": current_sum}
+    yield {"type": "solution", "mask": mask, "sum": current_sum}
     yield {"type": "done"}
 
 # -----------------------------------------------------------------------------------
 # Visualizer App
 
+MIN_SIZE, MAX_SIZE = 5, 120
+FRAME_MS = 16
+
 class AlgorithmVisualizerPro(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -176,6 +418,22 @@ class AlgorithmVisualizerPro(tk.Tk):
         self.generator = None
         self.current_operation = None
         self.after_id = None
+        # generator runs on a worker thread that hands batches of operations to the UI via frame_q
+        self.frame_q = None
+        self._producer_thread = None
+        self._producer_stop = threading.Event()
+        self._leftover = []
+        self._pending = collections.deque()
+        # bars moved and highlight/status recorded since the last drawn frame
+        self._dirty = set()
+        self._dirty_cells = []
+        self._frame_colors = None
+        self._frame_line = None
+        self._frame_status = None
+        # fractional operations owed to the next fast tick, when the last tick ran, and when a frame was last drawn
+        self._op_budget = 0.0
+        self._last_tick_ns = 0
+        self._last_frame_ns = 0
 
     def _build_ui(self):
         control_frame = ttk.Frame(self)
@@ -185,19 +443,23 @@ class AlgorithmVisualizerPro(tk.Tk):
         ttk.Label(control_frame, text="Algorithm:").pack(side=tk.LEFT)
         self.algo_var = tk.StringVar(value="Bubble Sort")
         algo_menu = ttk.OptionMenu(control_frame, self.algo_var, "Bubble Sort",
-                                    "Bubble Sort", "Selection Sort", "Insertion Sort", "Merge Sort", "Quick Sort", "Subset Sum")
+                                    "Bubble Sort", "Selection Sort", "Insertion Sort", "Merge Sort", "Quick Sort", "Subset Sum",
+                                    "Subset Sum (Backtracking)")
         algo_menu.pack(side=tk.LEFT, padx=6)
 
         # Array size
         ttk.Label(control_frame, text="Array size:").pack(side=tk.LEFT, padx=(12,0))
         self.size_var = tk.IntVar(value=30)
-        size_spin = ttk.Spinbox(control_frame, from_=5, to=120, textvariable=self.size_var, width=5)
+        size_spin = ttk.Spinbox(control_frame, from_=MIN_SIZE, to=MAX_SIZE, textvariable=self.size_var, width=5)
         size_spin.pack(side=tk.LEFT, padx=4)
 
         # Speed slider
         ttk.Label(control_frame, text="Speed:").pack(side=tk.LEFT, padx=(12,0))
         self.speed_var = tk.DoubleVar(value=50.0)
-        speed_slider = ttk.Scale(control_frame, from_=1, to=200, variable=self.speed_var, orient=tk.HORIZONTAL)
+        # the animation loop and the worker thread read the cached self._speed, not the Tcl variable
+        self._speed = 50.0
+        speed_slider = ttk.Scale(control_frame, from_=1, to=200, variable=self.speed_var, orient=tk.HORIZONTAL,
+                                 command=self._on_speed)
         speed_slider.pack(side=tk.LEFT, padx=4)
 
         # Target for subset sum
@@ -238,59 +500,164 @@ class AlgorithmVisualizerPro(tk.Tk):
 
         # Pseudocode box
         ttk.Label(right_panel, text="Pseudocode / Info:").pack(anchor=tk.NW, pady=(4,0))
-        self.code_text = tk.Text(right_panel, width=40, height=25, wrap=tk.NONE)
+        self.code_text = tk.Text(right_panel, width=40, height=25, wrap=tk.NONE, insertwidth=0)
         self.code_text.pack(fill=tk.Y, padx=4, pady=4)
-        self.code_text.configure(state=tk.DISABLED)
+        # stays in NORMAL state so highlighting doesn't need to toggle it; edits are swallowed instead
+        self.code_text.bind('<Key>', self._code_text_key)
+        # copy/select-all come with Control, and on macOS also with Command (Mod1 in the event state)
+        self._copy_modifiers = 0x4 | (0x8 if self.tk.call('tk', 'windowingsystem') == 'aqua' else 0)
+        for seq in ('<<Paste>>', '<<PasteSelection>>', '<<Cut>>'):
+            self.code_text.bind(seq, lambda e: 'break')
+        self.code_text.tag_config('hl', background='yellow')
+        self._current_code_line = 0
+        self._current_pseudocode_key = None
 
         # Status
         self.status_var = tk.StringVar(value="Ready")
         ttk.Label(right_panel, textvariable=self.status_var).pack(anchor=tk.SW, pady=(10,0))
 
         # Initialize array and draw
-        self.array = [random.randint(5, 400) for _ in range(self.size_var.get())]
+        # array('i') keeps the values as contiguous C ints instead of boxed Python ints
+        self.array = self._sized_random(self.size_var.get())
+        self._max_val = max(self.array)
         self.rects = []
+        self._dp_grid = None
+        # canvas size is cached here and refreshed only from <Configure>, not queried every frame
+        self._w = max(200, self.canvas.winfo_width())
+        self._h = max(200, self.canvas.winfo_height())
         self.draw_array()
 
-        # Bind resizing
-        self.bind('<Configure>', self._on_resize)
+        # Bind resizing on the canvas itself, so focus/geometry events on other widgets don't redraw
+        self.canvas.bind('<Configure>', self._on_resize)
 
     def _on_resize(self, event):
         # redraw on resize
-        if event.widget == self:
-            self.draw_array()
+        self._w = max(200, event.width)
+        self._h = max(200, event.height)
+        self.draw_array()
 
-    def draw_array(self, highlight_indices=(), colors=None):
+    def draw_array(self):
+        # full rebuild; only used on resize/randomize/reset, animation steps go through _update_bar/_paint
         self.canvas.delete('all')
-        w = max(200, self.canvas.winfo_width())
-        h = max(200, self.canvas.winfo_height())
+        self.rects = []
+        self.text_ids = []
+        self._colored = set()
+        w, h = self._w, self._h
         n = len(self.array)
         if n == 0:
             return
-        bar_width = w / n
-        max_val = max(self.array)
-        self.rects = []
+        # _max_val is set whenever a new array is generated: sorting only permutes values, so it never changes mid-run
+        # while the DP table is shown the bars are scaled into the space below it, so tall bars and labels stay visible
+        top = self._dp_grid['h'] + 20 if self._dp_grid else 0
+        scale = self._scale = (h - 20 - top) / self._max_val
+        labels = n <= 30
+        # integer pixel edges; each bar's right edge is the next bar's left edge, so only one is computed per bar
+        left = 0
+        path = str(self.canvas)
+        cmds = []
         for i, val in enumerate(self.array):
-            x0 = i*bar_width
-            x1 = (i+1)*bar_width - 1
-            bar_h = (val / max_val) * (h - 20)
-            y0 = h - bar_h
-            y1 = h
-            color = 'steelblue'
-            if colors and i < len(colors) and colors[i]:
-                color = colors[i]
-            elif i in highlight_indices:
-                color = 'orange'
-            rect = self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline='')
+            right = (i+1)*w // n
+            x0, x1 = left, right - 1
+            left = right
+            y0 = h - int(val * scale)
+            cmds.append(f'[{path} create rectangle {x0} {y0} {x1} {h} -fill steelblue -outline {{}}]')
             # small label for large arrays would clutter; we only add for small arrays
-            if n <= 30:
-                self.canvas.create_text((x0+x1)/2, y0-8, text=str(val), anchor=tk.S)
-            self.rects.append(rect)
+            if labels:
+                cmds.append(f'[{path} create text {(x0+x1)//2} {y0-8} -text {val} -anchor s]')
+        # create every item in a single Tcl round-trip; the script returns the new item ids in order
+        ids = [int(item) for item in self.tk.splitlist(self.tk.eval('list ' + ' '.join(cmds)))]
+        if labels:
+            self.rects = ids[0::2]
+            self.text_ids = ids[1::2]
+        else:
+            self.rects = ids
+        if self._dp_grid:
+            self._place_dp_grid()
+
+    def _bar_geometry(self, i, val):
+        n = len(self.array)
+        x0 = i*self._w // n
+        x1 = (i+1)*self._w // n - 1
+        return x0, self._h - int(val * self._scale), x1, self._h
+
+    def _update_bar(self, i):
+        # move a single bar (and its label) to match self.array[i]
+        if i >= len(self.rects):
+            return
+        val = self.array[i]
+        x0, y0, x1, y1 = self._bar_geometry(i, val)
+        self.canvas.coords(self.rects[i], x0, y0, x1, y1)
+        if self.text_ids:
+            self.canvas.coords(self.text_ids[i], (x0+x1)//2, y0-8)
+            self.canvas.itemconfig(self.text_ids[i], text=str(val))
+
+    def _paint(self, colors):
+        # colors: {index: color}; bars colored on the previous frame but not in colors go back to steelblue
+        for i in self._colored - colors.keys():
+            self.canvas.itemconfig(self.rects[i], fill='steelblue')
+        for i, color in colors.items():
+            self.canvas.itemconfig(self.rects[i], fill=color)
+        self._colored = set(colors)
+
+    def _show_dp_grid(self, n, target):
+        # SS[i][t] table for the DP subset sum, drawn into an image above the bars:
+        # rows are i = 0..n, columns t = 0..target (with a large target several t share a pixel column)
+        self._hide_dp_grid()
+        if target < 0:
+            return
+        rows, cols = n + 1, target + 1
+        gw = max(1, min(self._w - 20, cols * 12))
+        gh = max(1, min(self._h // 3, rows * 12))
+        img = tk.PhotoImage(width=gw, height=gh)
+        img.put('#e6e6e6', to=(0, 0, gw, gh))
+        self._dp_grid = {'image': img, 'rows': rows, 'cols': cols, 'w': gw, 'h': gh}
+        # base row: SS[n][t] is True only for t == 0
+        y0, y1 = self._dp_grid_rows(n)
+        img.put('#f4c7c3', to=(0, y0, gw, y1))
+        self._dp_grid_cell(n, 0, True)
+        # full redraw so the bars shrink to make room for the table
+        self.draw_array()
+
+    def _hide_dp_grid(self):
+        # give the table's space back to the bars
+        if self._dp_grid:
+            self._dp_grid = None
+            self.draw_array()
+
+    def _place_dp_grid(self):
+        g = self._dp_grid
+        self.canvas.create_image(10, 10, image=g['image'], anchor=tk.NW, tags='dpgrid')
+        self.canvas.create_rectangle(9, 9, 10 + g['w'], 10 + g['h'], outline='gray40', tags='dpgrid')
+
+    def _dp_grid_rows(self, i):
+        g = self._dp_grid
+        y0 = i*g['h'] // g['rows']
+        return y0, max(y0 + 1, (i+1)*g['h'] // g['rows'])
+
+    def _dp_grid_cell(self, i, t, value):
+        g = self._dp_grid
+        x0 = t*g['w'] // g['cols']
+        x1 = max(x0 + 1, (t+1)*g['w'] // g['cols'])
+        y0, y1 = self._dp_grid_rows(i)
+        g['image'].put('lightgreen' if value else '#f4c7c3', to=(x0, y0, x1, y1))
 
     def randomize(self):
-        size = max(2, min(200, self.size_var.get()))
-        self.array = [random.randint(5, 400) for _ in range(size)]
+        # operations carry index deltas against self.array, so a pending run can't survive a new array
+        if self.running:
+            self.pause()
+        self.generator = None
+        self.current_operation = None
+        self._pending.clear()
+        self.array = self._sized_random(self.size_var.get())
+        self._max_val = max(self.array)
+        self._dp_grid = None
         self.draw_array()
-        self.status_var.set('Randomized array of size {}'.format(size))
+        self.status_var.set('Randomized array of size {}'.format(len(self.array)))
+
+    def _sized_random(self, size):
+        # one clamp shared by startup, Randomize and Reset, matching the spinbox range
+        size = max(MIN_SIZE, min(MAX_SIZE, size))
+        return array.array('i', random.choices(range(5, 401), k=size))
 
     def start(self):
         if self.running:
@@ -303,23 +670,29 @@ class AlgorithmVisualizerPro(tk.Tk):
         self.status_var.set(f'Running {alg}...')
 
         # prepare generator
-        arr_copy = self.array.copy()
+        arr_copy = self.array[:]
+        self._hide_dp_grid()
         if alg == 'Bubble Sort':
-            self.generator = bubble_sort_generator(arr_copy)
+            self.generator = sort_generator('bubble', arr_copy)
             self._set_pseudocode('bubble')
         elif alg == 'Selection Sort':
-            self.generator = selection_sort_generator(arr_copy)
+            self.generator = sort_generator('selection', arr_copy)
             self._set_pseudocode('selection')
         elif alg == 'Insertion Sort':
-            self.generator = insertion_sort_generator(arr_copy)
+            self.generator = sort_generator('insertion', arr_copy)
             self._set_pseudocode('insertion')
         elif alg == 'Merge Sort':
-            self.generator = merge_sort_generator(arr_copy)
+            self.generator = sort_generator('merge', arr_copy)
             self._set_pseudocode('merge')
         elif alg == 'Quick Sort':
-            self.generator = quick_sort_generator(arr_copy)
+            self.generator = sort_generator('quick', arr_copy)
             self._set_pseudocode('quick')
         elif alg == 'Subset Sum':
+            target = self.target_var.get()
+            self.generator = subset_sum_dp_generator(arr_copy, target)
+            self._set_pseudocode('subset_dp')
+            self._show_dp_grid(len(arr_copy), target)
+        elif alg == 'Subset Sum (Backtracking)':
             target = self.target_var.get()
             self.generator = subset_sum_generator(arr_copy, target)
             self._set_pseudocode('subset')
@@ -328,24 +701,149 @@ class AlgorithmVisualizerPro(tk.Tk):
             self.running = False
             return
 
-        # kick off the animation loop
+        # start the worker thread, then kick off the animation loop
+        self._pending.clear()
+        self._op_budget = 0.0
+        self._last_tick_ns = self._last_frame_ns = time.monotonic_ns()
+        self.frame_q = queue.Queue(maxsize=4)
+        self._producer_stop = threading.Event()
+        self._producer_thread = threading.Thread(target=self._producer,
+                                                 args=(self.generator, self.frame_q, self._producer_stop),
+                                                 daemon=True)
+        self._producer_thread.start()
         self._run_step()
 
+    def _on_speed(self, value):
+        self._speed = float(value)
+
+    def _ops_per_second(self):
+        # the original pace (one operation every 300 - speed ms) up to speed 100, then doubling every
+        # 10 steps, so the slider runs continuously from ~3 ops/s up to ~10k ops/s
+        speed = self._speed
+        rate = 1000.0 / (300 - speed)
+        if speed > 100:
+            rate *= 2 ** ((speed - 100) / 10)
+        return rate
+
+    def _batch_size(self):
+        # worker batches hold roughly one frame's worth of operations
+        return max(1, int(self._ops_per_second() * FRAME_MS / 1000))
+
+    def _producer(self, generator, frame_q, stop):
+        # worker thread: only touches the generator and the queue, never Tk
+        batch = []
+        try:
+            stride = self._batch_size()
+            for op in generator:
+                batch.append(op)
+                if len(batch) >= stride:
+                    if not self._put_batch(frame_q, batch, stop):
+                        self._leftover = batch
+                        return
+                    batch = []
+                    stride = self._batch_size()
+        except Exception as exc:
+            # the error goes down the stream after the last good operation; the UI reports it and ends the run
+            batch.append(exc)
+            if not self._put_batch(frame_q, batch, stop):
+                self._leftover = batch
+            return
+        if batch and not self._put_batch(frame_q, batch, stop):
+            self._leftover = batch
+            return
+        # None tells the UI the generator is exhausted
+        self._put_batch(frame_q, None, stop)
+
+    def _put_batch(self, frame_q, batch, stop):
+        while not stop.is_set():
+            try:
+                frame_q.put(batch, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _stop_producer(self):
+        if self._producer_thread is None:
+            return
+        self._producer_stop.set()
+        self._producer_thread.join()
+        self._producer_thread = None
+        # keep what the worker already pulled from the generator so Step carries on from the last drawn frame
+        while True:
+            try:
+                batch = self.frame_q.get_nowait()
+            except queue.Empty:
+                break
+            if batch is not None:
+                self._pending.extend(batch)
+        self._pending.extend(self._leftover)
+        self._leftover = []
+
     def _run_step(self):
         if not self.running or self.generator is None:
             return
-        try:
-            op = next(self.generator)
+        rate = self._ops_per_second()
+        now = time.monotonic_ns()
+        slow = rate * FRAME_MS <= 1000
+        if slow:
+            # slow enough to show every operation: one per tick, the tick length follows the speed
+            stride = 1
+            delay = round(1000 / rate)
+            self._op_budget = 0.0
+        else:
+            # fast: run from Tk's idle queue, each tick taking only the operations owed for the time since the last one
+            elapsed = min(now - self._last_tick_ns, 100_000_000) / 1e9
+            self._op_budget += rate * elapsed
+            stride = int(self._op_budget)
+            self._op_budget -= stride
+        self._last_tick_ns = now
+        consumed = 0
+        finished = False
+        error = None
+        while consumed < stride:
+            if not self._pending:
+                try:
+                    batch = self.frame_q.get_nowait()
+                except queue.Empty:
+                    # worker hasn't produced the next batch yet
+                    break
+                if batch is None:
+                    finished = True
+                    break
+                self._pending.extend(batch)
+            op = self._pending.popleft()
+            if isinstance(op, Exception):
+                error = op
+                break
             self.current_operation = op
-            self._apply_operation(op)
-            delay = int(max(1, 300 - self.speed_var.get()))
-            self.after_id = self.after(delay, self._run_step)
-        except StopIteration:
+            self._record_op(op)
+            consumed += 1
+        # in fast mode ticks are much shorter than a frame, so only draw once FRAME_MS has passed since the last one
+        if slow or finished or error or now - self._last_frame_ns >= FRAME_MS * 1_000_000:
+            self._flush_frame()
+            self._last_frame_ns = now
+        if finished or error:
             self.running = False
+            self._producer_thread = None
             self.start_btn.configure(state=tk.NORMAL)
             self.status_var.set('Finished')
             self.generator = None
             self.current_operation = None
+            if error:
+                self._report_error(error)
+            return
+        if slow:
+            if consumed == 0:
+                # worker hasn't caught up; check again next frame
+                delay = min(delay, FRAME_MS)
+            self.after_id = self.after(delay, self._run_step)
+        elif consumed:
+            # operations are flowing: come back as soon as Tk has handled pending events
+            self.after_id = self.after_idle(self._run_step)
+        else:
+            # no whole operation owed yet (or the worker is behind): wait a millisecond instead of spinning on idle
+            self.after_id = self.after(1, self._run_step)
 
     def pause(self):
         if not self.running:
@@ -356,6 +854,9 @@ class AlgorithmVisualizerPro(tk.Tk):
                 self.after_cancel(self.after_id)
             except Exception:
                 pass
+        # fast mode may have recorded operations that haven't been drawn yet
+        self._flush_frame()
+        self._stop_producer()
         self.start_btn.configure(state=tk.NORMAL)
         self.status_var.set('Paused')
 
@@ -366,23 +867,29 @@ class AlgorithmVisualizerPro(tk.Tk):
         if self.generator is None:
             # if no generator, prepare one
             alg = self.algo_var.get()
-            arr_copy = self.array.copy()
+            arr_copy = self.array[:]
+            self._hide_dp_grid()
             if alg == 'Bubble Sort':
-                self.generator = bubble_sort_generator(arr_copy)
+                self.generator = sort_generator('bubble', arr_copy)
                 self._set_pseudocode('bubble')
             elif alg == 'Selection Sort':
-                self.generator = selection_sort_generator(arr_copy)
+                self.generator = sort_generator('selection', arr_copy)
                 self._set_pseudocode('selection')
             elif alg == 'Insertion Sort':
-                self.generator = insertion_sort_generator(arr_copy)
+                self.generator = sort_generator('insertion', arr_copy)
                 self._set_pseudocode('insertion')
             elif alg == 'Merge Sort':
-                self.generator = merge_sort_generator(arr_copy)
+                self.generator = sort_generator('merge', arr_copy)
                 self._set_pseudocode('merge')
             elif alg == 'Quick Sort':
-                self.generator = quick_sort_generator(arr_copy)
+                self.generator = sort_generator('quick', arr_copy)
                 self._set_pseudocode('quick')
             elif alg == 'Subset Sum':
+                target = self.target_var.get()
+                self.generator = subset_sum_dp_generator(arr_copy, target)
+                self._set_pseudocode('subset_dp')
+                self._show_dp_grid(len(arr_copy), target)
+            elif alg == 'Subset Sum (Backtracking)':
                 target = self.target_var.get()
                 self.generator = subset_sum_generator(arr_copy, target)
                 self._set_pseudocode('subset')
@@ -390,90 +897,141 @@ class AlgorithmVisualizerPro(tk.Tk):
                 messagebox.showerror('Algorithm Visualizer', 'Unknown algorithm: ' + alg)
                 return
         try:
-            op = next(self.generator)
-            self.current_operation = op
-            self._apply_operation(op)
+            op = self._pending.popleft() if self._pending else next(self.generator)
         except StopIteration:
             self.generator = None
             self.status_var.set('Finished')
+            return
+        except Exception as exc:
+            op = exc
+        if isinstance(op, Exception):
+            self.generator = None
+            self.current_operation = None
+            self._report_error(op)
+            return
+        self.current_operation = op
+        self._apply_operation(op)
+
+    def _report_error(self, exc):
+        # an algorithm raised: whatever was queued after it is meaningless, so drop it and tell the user
+        self._pending.clear()
+        self.status_var.set('Error: {}'.format(exc))
+        messagebox.showerror('Algorithm Visualizer', '{} failed: {}: {}'.format(self.algo_var.get(), type(exc).__name__, exc))
 
     def reset(self):
         if self.running:
             self.pause()
         self.generator = None
         self.current_operation = None
-        self.array = [random.randint(5, 400) for _ in range(max(5, min(200, self.size_var.get())))]
+        self._pending.clear()
+        self.array = self._sized_random(self.size_var.get())
+        self._max_val = max(self.array)
+        self._dp_grid = None
         self.draw_array()
         self.status_var.set('Reset')
 
     def _apply_operation(self, op):
+        self._record_op(op)
+        self._flush_frame()
+
+    def _record_op(self, op):
+        # apply the array mutation and remember what the next frame should show; nothing is drawn here
         t = op.get('type')
+        n = len(self.rects)
+        colors = None
+        line = None
         if t == 'compare':
             i,j = op['indices']
-            colors = [None]*len(self.array)
-            if i < len(colors): colors[i] = 'orange'
-            if j < len(colors): colors[j] = 'orange'
-            self.draw_array(highlight_indices=(), colors=colors)
-            self._highlight_code_line(1)
-            self.status_var.set(f'Comparing indices {i} and {j}')
+            colors = {k: 'orange' for k in (i, j) if k < n}
+            line = 1
+            status = f'Comparing indices {i} and {j}'
         elif t == 'swap':
-            self.array = op.get('array', self.array)
             i,j = op['indices']
-            colors = ['lightgreen']*len(self.array)
-            if i < len(colors): colors[i] = 'red'
-            if j < len(colors): colors[j] = 'red'
-            self.draw_array(colors=colors)
-            self._highlight_code_line(2)
-            self.status_var.set(f'Swapped indices {i} and {j}')
+            self.array[i], self.array[j] = self.array[j], self.array[i]
+            self._dirty.add(i)
+            self._dirty.add(j)
+            colors = {k: 'red' for k in (i, j) if k < n}
+            line = 2
+            status = f'Swapped indices {i} and {j}'
         elif t == 'shift':
-            self.array = op.get('array', self.array)
-            self.draw_array()
-            self._highlight_code_line(3)
-            self.status_var.set('Shifting elements')
+            self.array[op['index']] = op['value']
+            self._dirty.add(op['index'])
+            colors = {}
+            line = 3
+            status = 'Shifting elements'
         elif t == 'insert':
-            self.array = op.get('array', self.array)
-            self.draw_array()
-            self._highlight_code_line(4)
-            self.status_var.set(f'Inserted at index {op.get("index")}')
+            self.array[op['index']] = op['value']
+            self._dirty.add(op['index'])
+            colors = {}
+            line = 4
+            status = f'Inserted at index {op.get("index")}'
         elif t == 'mergewrite':
-            self.array = op.get('array', self.array)
-            self.draw_array()
-            self._highlight_code_line(5)
-            self.status_var.set(f'Writing merged value at index {op.get("index")}')
+            self.array[op['index']] = op['value']
+            self._dirty.add(op['index'])
+            colors = {}
+            line = 5
+            status = f'Writing merged value at index {op.get("index")}'
         elif t == 'highlight':
             indices = op.get('indices', ())
-            self.draw_array(highlight_indices=indices)
-            self.status_var.set(f'Highlight index {indices}')
+            colors = {k: 'orange' for k in indices if k < n}
+            status = f'Highlight index {indices}'
         elif t == 'decide':
-            chosen = op.get('chosen', [])
-            colors = []
-            for c in chosen:
-                colors.append('lightgreen' if c else None)
-            self.draw_array(colors=colors)
+            mask = op.get('mask', 0)
+            colors = {k: 'lightgreen' for k in range(n) if mask >> k & 1}
             idx = op.get('index')
             choice = op.get('choice')
-            self.status_var.set(f'Index {idx} -> {"Include" if choice else "Exclude"}')
-            self._highlight_code_line(6)
+            status = f'Index {idx} -> {"Include" if choice else "Exclude"}'
+            line = 6
         elif t == 'check':
-            chosen = op.get('chosen', [])
+            mask = op.get('mask', 0)
             s = op.get('sum', 0)
-            colors = ['lightgreen' if c else None for c in chosen]
-            self.draw_array(colors=colors)
-            self.status_var.set(f'Checked sum = {s}')
+            colors = {k: 'lightgreen' for k in range(n) if mask >> k & 1}
+            status = f'Checked sum = {s}'
         elif t == 'solution':
-            chosen = op.get('chosen', [])
+            mask = op.get('mask', 0)
             s = op.get('sum', 0)
-            colors = ['gold' if c else None for c in chosen]
-            self.draw_array(colors=colors)
-            self.status_var.set(f'Solution! sum={s}')
-            self._highlight_code_line(7)
+            colors = {k: 'gold' for k in range(n) if mask >> k & 1}
+            status = f'Solution! sum={s}'
+            line = 7
+        elif t == 'dp_fill':
+            i = op.get('i')
+            colors = {i: 'lightgreen' if op.get('value') else 'orange'} if i < n else {}
+            self._dirty_cells.append((i, op.get('t'), op.get('value')))
+            status = f'SS[{i}][{op.get("t")}] = {op.get("value")}'
+            line = 4
+        elif t == 'nosolution':
+            colors = {}
+            status = f'No subset sums to {op.get("sum")}'
         elif t == 'done':
-            self.array = op.get('array', self.array)
-            self.draw_array()
-            self.status_var.set('Done')
-            self._highlight_code_line(0)
+            colors = {}
+            status = 'Done'
+            line = 0
         else:
-            self.status_var.set(str(op))
+            status = str(op)
+        if colors is not None:
+            self._frame_colors = colors
+        if line is not None:
+            self._frame_line = line
+        self._frame_status = status
+
+    def _flush_frame(self):
+        # draw everything recorded since the last frame: moved bars, then the latest highlight
+        for i in self._dirty:
+            self._update_bar(i)
+        self._dirty.clear()
+        if self._dp_grid:
+            for i, t, value in self._dirty_cells:
+                self._dp_grid_cell(i, t, value)
+        self._dirty_cells.clear()
+        if self._frame_colors is not None:
+            self._paint(self._frame_colors)
+            self._frame_colors = None
+        if self._frame_line is not None:
+            self._highlight_code_line(self._frame_line)
+            self._frame_line = None
+        if self._frame_status is not None:
+            self.status_var.set(self._frame_status)
+            self._frame_status = None
 
     # Pseudocode handling
     PSEUDOCODES = {
@@ -518,44 +1076,79 @@ class AlgorithmVisualizerPro(tk.Tk):
             '  if i==n: check sum',
             '  choose exclude i, backtrack(i+1, sum)',
             '  choose include i, backtrack(i+1, sum+arr[i])'
+        ],
+        'subset_dp': [
+            'SS[i][0] = True for all i',
+            'for i from n-1 down to 0:',
+            '  for t from 0 to target:',
+            '    SS[i][t] = SS[i+1][t] or SS[i+1][t-A[i]]',
+            'walk back from SS[0][target]:',
+            '  include i if not SS[i+1][t]',
+            'report chosen subset'
         ]
     }
 
+    CODE_TEXT_NAV_KEYS = {'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next'}
+
+    def _code_text_key(self, event):
+        # read-only pseudocode panel: let navigation, copy and select-all through, swallow anything that edits
+        if event.keysym in ('Tab', 'ISO_Left_Tab'):
+            # Text's own Tab binding inserts a tab, so do the focus traversal here
+            if event.keysym == 'ISO_Left_Tab' or event.state & 0x1:
+                target = event.widget.tk_focusPrev()
+            else:
+                target = event.widget.tk_focusNext()
+            if target is not None:
+                target.focus_set()
+            return 'break'
+        if event.keysym in self.CODE_TEXT_NAV_KEYS:
+            return None
+        if event.state & self._copy_modifiers and event.keysym in ('c', 'C', 'a', 'A', 'slash', 'Insert'):
+            return None
+        return 'break'
+
     def _set_pseudocode(self, key):
+        if key == self._current_pseudocode_key:
+            return
+        self._current_pseudocode_key = key
         code = self.PSEUDOCODES.get(key, [])
-        self.code_text.configure(state=tk.NORMAL)
         self.code_text.delete('1.0', tk.END)
-        for line in code:
-            self.code_text.insert(tk.END, line + "\n")
-        self.code_text.configure(state=tk.DISABLED)
+        self.code_text.insert(tk.END, "\n".join(code) + "\n")
+        self._current_code_line = 0
 
     def _highlight_code_line(self, lineno):
         # lineno: 0 means clear, else highlight 1-indexed line
-        self.code_text.configure(state=tk.NORMAL)
+        if lineno == self._current_code_line:
+            return
+        self._current_code_line = lineno
         self.code_text.tag_remove('hl', '1.0', tk.END)
         if lineno > 0:
             start = f"{lineno}.0"
             end = f"{lineno}.end"
             self.code_text.tag_add('hl', start, end)
-            self.code_text.tag_config('hl', background='yellow')
-        self.code_text.configure(state=tk.DISABLED)
 
     def export_png(self):
-        if not PIL_AVAILABLE:
-            messagebox.showwarning('Export PNG', 'Pillow not available. Install pillow to enable export (pip install pillow)')
-            return
-        # get file
-        path = filedialog.asksaveasfilename(defaultextension='.png', filetypes=[('PNG Image','*.png')])
+        # get file; without Pillow we can still save the canvas as PostScript
+        if PIL_AVAILABLE:
+            path = filedialog.asksaveasfilename(defaultextension='.png', filetypes=[('PNG Image','*.png'), ('PostScript','*.ps')])
+        else:
+            path = filedialog.asksaveasfilename(defaultextension='.ps', filetypes=[('PostScript','*.ps')])
         if not path:
             return
-        # use ImageGrab to capture window area
-        x = self.winfo_rootx()
-        y = self.winfo_rooty()
-        w = x + self.winfo_width()
-        h = y + self.winfo_height()
-        img = ImageGrab.grab(bbox=(x, y, w, h))
-        img.save(path)
-        messagebox.showinfo('Export PNG', f'Exported screenshot to {path}')
+        # the canvas renders its own items to PostScript, no screen capture involved
+        ps = self.canvas.postscript(colormode='color', x=0, y=0, width=self._w, height=self._h)
+        if PIL_AVAILABLE and not path.lower().endswith(('.ps', '.eps')):
+            try:
+                # Pillow needs Ghostscript to rasterize PostScript
+                img = Image.open(io.BytesIO(ps.encode('utf-8')))
+                img.save(path)
+                messagebox.showinfo('Export PNG', f'Exported canvas to {path}')
+                return
+            except Exception:
+                path = os.path.splitext(path)[0] + '.ps'
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(ps)
+        messagebox.showinfo('Export PNG', f'Exported canvas as PostScript to {path}')
 
 
 if __name__ == '__main__':